@@ -18,8 +18,15 @@ See config.py for configuration options and defaults.
 __version__ = "0.1.0"
 __author__ = "Brian Krabach"
 
-from .config import Config, DevConfig, WindowConfig, load_config
-from .cli import main_dev
+# Public names are resolved on first access (PEP 562) so that importing the
+# package - e.g. from the console script - doesn't import config/cli eagerly.
+_LAZY_ATTRS = {
+    "Config": ".config",
+    "DevConfig": ".config",
+    "WindowConfig": ".config",
+    "load_config": ".config",
+    "main_dev": ".cli",
+}
 
 __all__ = [
     "__version__",
@@ -29,3 +36,18 @@ __all__ = [
     "load_config",
     "main_dev",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
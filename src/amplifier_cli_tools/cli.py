@@ -2,7 +2,7 @@
 
 Thin layer that parses arguments and calls business logic modules.
 All business logic is in dev.py and setup.py - this module only handles:
-- Argument parsing via argparse
+- Argument parsing (a fast path for the workspace command, argparse otherwise)
 - Error handling and exit codes
 - User confirmation prompts
 
@@ -11,13 +11,106 @@ Entry Points
 - main_dev(): amplifier-dev command (with setup/config subcommands)
 """
 
-import argparse
+from __future__ import annotations
+
+import os
 import sys
-from pathlib import Path
 
-from .config import load_config
-from . import dev
-from . import tmux
+from . import __version__
+
+# Keep module import down to os/sys: pathlib, types and typing are imported
+# where they're used, so --version and completion don't load them
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from types import SimpleNamespace
+
+
+_DESCRIPTION = "Amplifier development workspace manager."
+
+_WORKSPACE_EPILOG = """
+Subcommands:
+  setup              First-time setup: install dependencies and create configs
+  config             View and modify configuration
+
+Examples:
+  amplifier-dev ~/myproject            Create/attach to workspace
+  amplifier-dev -k ~/myproject         Kill session (keep files)
+  amplifier-dev -f ~/myproject         Kill session and start fresh
+  amplifier-dev -d ~/myproject         Destroy workspace (with confirmation)
+  amplifier-dev --no-tmux ~/myproject  Run without tmux
+  amplifier-dev setup                  First-time setup
+  amplifier-dev config show            Show configuration
+"""
+
+
+# Static completion candidates, so completion never builds a parser
+_COMPLETION_WORDS = (
+    "setup",
+    "config",
+    "-k",
+    "--kill",
+    "-f",
+    "--fresh",
+    "-d",
+    "--destroy",
+    "-p",
+    "--prompt",
+    "-e",
+    "--extra",
+    "-c",
+    "--config",
+    "--tmux",
+    "--no-tmux",
+    "-V",
+    "--version",
+    "-h",
+    "--help",
+)
+_SETUP_COMPLETION_WORDS = ("-y", "--yes", "--skip-tools", "--skip-tmux", "-h", "--help")
+_CONFIG_COMPLETION_WORDS = (
+    "show",
+    "get",
+    "set",
+    "add",
+    "remove",
+    "reset",
+    "tmux-on",
+    "tmux-off",
+)
+
+
+def _emit_completions(argv: list[str]) -> None:
+    """Print completion candidates for the last word in argv.
+
+    argv holds the words typed after the program name, ending with the
+    (possibly empty) word being completed. Candidates are printed one
+    per line; nothing is printed when only a path fits (e.g. WORKDIR),
+    so the shell can fall back to filename completion.
+    """
+    current = argv[-1] if argv else ""
+    if len(argv) <= 1:
+        words = _COMPLETION_WORDS
+    elif argv[0] == "setup":
+        words = _SETUP_COMPLETION_WORDS
+    elif argv[0] == "config" and len(argv) == 2:
+        words = _CONFIG_COMPLETION_WORDS
+    elif argv[0] == "config":
+        words = ()
+    else:
+        words = _COMPLETION_WORDS[2:]
+    for word in words:
+        if word.startswith(current):
+            sys.stdout.write(word + "\n")
+
+
+def _print_error(error: BaseException) -> None:
+    """Report an error on stderr.
+
+    Uses only builtins and sys, so reporting can't itself fail on an
+    import (the handlers also catch ImportError from deferred imports).
+    """
+    sys.stderr.write("Error: " + str(error) + "\n")
 
 
 def _confirm(message: str) -> bool:
@@ -29,30 +122,40 @@ def _confirm(message: str) -> bool:
     Returns:
         True if user confirms with 'y' or 'Y', False otherwise.
     """
-    try:
-        response = input(f"{message}\n\nAre you sure? [y/N] ")
-        return response.lower() == "y"
-    except EOFError:
-        return False
+    # Plain stdin read rather than input(), which may pull in readline
+    sys.stdout.write(f"{message}\n\nAre you sure? [y/N] ")
+    sys.stdout.flush()
+    response = sys.stdin.readline()  # "" on EOF
+    return response in ("y\n", "Y\n", "y", "Y")
 
 
 def _cmd_run(args: argparse.Namespace) -> int:
     """Handle the default run command (create/attach workspace)."""
+    # Deferred so --help and argument errors don't pay for the workflow modules
+    from pathlib import Path
+
+    from . import dev
+    from . import tmux
+
     try:
-        config = load_config(args.config)
-        workdir = args.workdir.expanduser().resolve()
+        # Resolved (not just absolute) so '.', trailing slashes and symlinks
+        # all map to the same session name
+        workdir = Path(os.path.realpath(os.path.expanduser(args.workdir)))
 
-        # Determine tmux mode: CLI flag overrides config
-        use_tmux = args.use_tmux if args.use_tmux is not None else config.dev.use_tmux
+        # Query tmux once; the answer is threaded through the rest of the run
+        # so each branch doesn't spawn its own `tmux has-session`
+        session_name = dev.get_session_name(workdir)
+        has_session: bool | None = None
 
         # Handle --kill or --fresh: kill session only, don't delete files
         # --fresh implies --kill but continues to create new session
         if args.kill or args.fresh:
-            session_name = dev.get_session_name(workdir)
-            if tmux.session_exists(session_name):
+            has_session = tmux.session_exists(session_name)
+            if has_session:
                 print(f"Killing tmux session: {session_name}")
                 tmux.kill_session(session_name)
                 print("Session killed.")
+                has_session = False
             else:
                 print(f"No session '{session_name}' to kill.")
 
@@ -61,24 +164,34 @@ def _cmd_run(args: argparse.Namespace) -> int:
                 return 0
 
         if args.destroy:
-            # Derive session name from workdir
-            session_name = dev.get_session_name(workdir)
+            if has_session is None:
+                has_session = tmux.session_exists(session_name)
 
             # Build confirmation message
-            message = "This will:"
-            if tmux.session_exists(session_name):
-                message += f"\n  1. Kill tmux session '{session_name}'"
-                message += f"\n  2. Delete directory '{workdir}'"
-            else:
-                message += f"\n  1. Delete directory '{workdir}'"
+            steps = [f"Delete directory '{workdir}'"]
+            if has_session:
+                steps.insert(0, f"Kill tmux session '{session_name}'")
+            message = "This will:" + "".join(
+                f"\n  {i}. {step}" for i, step in enumerate(steps, 1)
+            )
 
             if not _confirm(message):
                 print("Aborted.")
                 return 0
 
+            # Ask tmux again: the session may have come or gone while the
+            # prompt was waiting for an answer
             dev.destroy_workspace(workdir, session_name)
             return 0
 
+        # Config is only needed from here on; --kill and --destroy exit above
+        from .config import load_config
+
+        config = load_config(args.config)
+
+        # Determine tmux mode: CLI flag overrides config
+        use_tmux = args.use_tmux if args.use_tmux is not None else config.dev.use_tmux
+
         # Run dev workflow
         success = dev.run_dev(
             config=config.dev,
@@ -86,6 +199,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
             prompt=args.prompt,
             extra=args.extra,
             no_tmux=not use_tmux,
+            has_session=has_session,
         )
         return 0 if success else 1
 
@@ -93,7 +207,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
         print("\nAborted.")
         return 130
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        _print_error(e)
         return 1
 
 
@@ -113,118 +227,169 @@ def _cmd_setup(args: argparse.Namespace) -> int:
         print("\nAborted.")
         return 130
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        _print_error(e)
         return 1
 
 
+# Accepted spellings for boolean config values (matched case-insensitively)
+_CONFIG_BOOL_VALUES = {
+    "true": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "no": False,
+    "off": False,
+}
+
+
+# Numeric forms accepted by `config set`; anything else stays a string.
+# Mirrors what int()/float() accept: digits may be grouped with single
+# underscores (1_000) and surrounding whitespace is allowed.
+_DIGITS = r"\d(?:_?\d)*"
+_INT_PATTERN = rf"\s*[+-]?{_DIGITS}\s*"
+_FLOAT_PATTERN = (
+    rf"\s*[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})"
+    rf"(?:[eE][+-]?{_DIGITS})?\s*"
+)
+
+
 def _parse_config_value(value_str: str):
     """Parse a config value string into appropriate Python type."""
-    lower = value_str.lower()
-    if lower in ("true", "yes", "on"):
-        return True
-    if lower in ("false", "no", "off"):
-        return False
-    # Try as number
-    try:
+    parsed = _CONFIG_BOOL_VALUES.get(value_str.lower())
+    if parsed is not None:
+        return parsed
+    # Match numbers up front instead of letting int()/float() raise on
+    # the common case (commands, URLs); re caches the compiled patterns
+    import re
+
+    if re.fullmatch(_INT_PATTERN, value_str):
         return int(value_str)
-    except ValueError:
-        try:
-            return float(value_str)
-        except ValueError:
-            return value_str
+    if re.fullmatch(_FLOAT_PATTERN, value_str):
+        return float(value_str)
+    return value_str
 
 
-def _cmd_config(args: argparse.Namespace) -> int:
-    """Handle the config subcommand."""
+def _config_show(args: argparse.Namespace) -> int:
     from . import config_manager
 
-    try:
-        if args.config_command is None or args.config_command == "show":
-            # Use full config display
-            print(config_manager.show_config_full())
-            return 0
+    # Use full config display
+    print(config_manager.show_config_full())
+    return 0
 
-        elif args.config_command == "get":
-            try:
-                value = config_manager.get_nested_setting(args.key)
-                if value is None:
-                    print(f"{args.key}: (not set)")
-                elif isinstance(value, list):
-                    print(f"{args.key}:")
-                    for i, item in enumerate(value):
-                        print(f"  [{i}] {item}")
-                elif isinstance(value, dict):
-                    print(f"{args.key}:")
-                    for k, v in value.items():
-                        print(f"  {k} = {v}")
-                elif isinstance(value, bool):
-                    print(f"{args.key} = {str(value).lower()}")
-                else:
-                    print(f"{args.key} = {value}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                return 1
-            return 0
 
-        elif args.config_command == "set":
-            try:
-                value = _parse_config_value(args.value)
-                config_manager.set_nested_setting(args.key, value)
-                print(f"Set {args.key} = {value}")
-                print(f"Config saved to: {config_manager.get_config_path()}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                return 1
-            return 0
+def _config_get(args: argparse.Namespace) -> int:
+    from . import config_manager
 
-        elif args.config_command == "add":
-            try:
-                result = config_manager.add_to_setting(args.key, args.value)
-                print(result)
-                print(f"Config saved to: {config_manager.get_config_path()}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                return 1
-            return 0
+    value = config_manager.get_nested_setting(args.key)
+    if value is None:
+        print(f"{args.key}: (not set)")
+    elif isinstance(value, list):
+        print(f"{args.key}:")
+        for i, item in enumerate(value):
+            print(f"  [{i}] {item}")
+    elif isinstance(value, dict):
+        print(f"{args.key}:")
+        for k, v in value.items():
+            print(f"  {k} = {v}")
+    elif isinstance(value, bool):
+        print(f"{args.key} = {str(value).lower()}")
+    else:
+        print(f"{args.key} = {value}")
+    return 0
 
-        elif args.config_command == "remove":
-            try:
-                result = config_manager.remove_from_setting(args.key, args.value)
-                print(result)
-                print(f"Config saved to: {config_manager.get_config_path()}")
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                return 1
-            return 0
 
-        elif args.config_command == "reset":
-            try:
-                key = getattr(args, "key", None)
-                result = config_manager.reset_setting(key)
-                print(result)
-            except ValueError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                return 1
-            return 0
+def _config_set(args: argparse.Namespace) -> int:
+    from . import config_manager
 
-        elif args.config_command == "tmux-on":
-            config_manager.set_setting("dev", "use_tmux", True)
-            print("Enabled tmux mode (dev.use_tmux = true)")
-            print(f"Config saved to: {config_manager.get_config_path()}")
-            return 0
+    value = _parse_config_value(args.value)
+    if not config_manager.set_nested_setting(args.key, value):
+        print(f"{args.key} is already {value} (no changes made)")
+        return 0
+    print(f"Set {args.key} = {value}")
+    print(f"Config saved to: {config_manager.get_config_path()}")
+    return 0
 
-        elif args.config_command == "tmux-off":
-            config_manager.set_setting("dev", "use_tmux", False)
-            print("Disabled tmux mode (dev.use_tmux = false)")
-            print("amplifier-dev will now run amplifier directly without tmux")
-            print(f"Config saved to: {config_manager.get_config_path()}")
-            return 0
 
-        else:
-            return 1
+def _config_add(args: argparse.Namespace) -> int:
+    from . import config_manager
+
+    result = config_manager.add_to_setting(args.key, args.value)
+    print(result)
+    # add_to_setting doesn't write when the value is already there
+    if not result.startswith("Value already exists"):
+        print(f"Config saved to: {config_manager.get_config_path()}")
+    return 0
+
+
+def _config_remove(args: argparse.Namespace) -> int:
+    from . import config_manager
+
+    result = config_manager.remove_from_setting(args.key, args.value)
+    print(result)
+    print(f"Config saved to: {config_manager.get_config_path()}")
+    return 0
+
+
+def _config_reset(args: argparse.Namespace) -> int:
+    from . import config_manager
 
+    key = getattr(args, "key", None)
+    result = config_manager.reset_setting(key)
+    print(result)
+    return 0
+
+
+def _config_tmux_on(args: argparse.Namespace) -> int:
+    from . import config_manager
+
+    if not config_manager.set_setting("dev", "use_tmux", True):
+        print("Tmux mode already enabled (dev.use_tmux = true)")
+        return 0
+    print("Enabled tmux mode (dev.use_tmux = true)")
+    print(f"Config saved to: {config_manager.get_config_path()}")
+    return 0
+
+
+def _config_tmux_off(args: argparse.Namespace) -> int:
+    from . import config_manager
+
+    if not config_manager.set_setting("dev", "use_tmux", False):
+        print("Tmux mode already disabled (dev.use_tmux = false)")
+        return 0
+    print("Disabled tmux mode (dev.use_tmux = false)")
+    print("amplifier-dev will now run amplifier directly without tmux")
+    print(f"Config saved to: {config_manager.get_config_path()}")
+    return 0
+
+
+# Handlers for `amplifier-dev config <command>`; bare `config` shows the config
+_CONFIG_COMMANDS = {
+    None: _config_show,
+    "show": _config_show,
+    "get": _config_get,
+    "set": _config_set,
+    "add": _config_add,
+    "remove": _config_remove,
+    "reset": _config_reset,
+    "tmux-on": _config_tmux_on,
+    "tmux-off": _config_tmux_off,
+}
+
+
+# Config commands that take no arguments (None = bare `config`)
+_BARE_CONFIG_COMMANDS = (None, "show", "tmux-on", "tmux-off")
+
+
+def _cmd_config(args: argparse.Namespace) -> int:
+    """Handle the config subcommand."""
+    handler = _CONFIG_COMMANDS.get(args.config_command)
+    if handler is None:
+        return 1
+
+    try:
+        return handler(args)
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        _print_error(e)
         return 1
 
 
@@ -239,23 +404,32 @@ def main_dev() -> int:
     Returns:
         Exit code (0 success, 1 error, 130 keyboard interrupt)
     """
+    argv = sys.argv[1:]
+
+    # Shell completion runs on every TAB press; answer from static tables
+    if os.environ.get("_AMPLIFIER_COMPLETE"):
+        _emit_completions(argv)
+        return 0
+
+    # Fast path: answer help/version without building the subcommand parsers
+    # or touching config/dev/tmux
+    if not argv or argv == ["-h"] or argv == ["--help"]:
+        _build_workspace_parser().print_help()
+        return 0
+    if argv == ["-V"] or argv == ["--version"]:
+        print(f"amplifier-dev {__version__}")
+        return 0
+
     # Check if first arg is a subcommand
-    if len(sys.argv) > 1 and sys.argv[1] in ("setup", "config"):
+    if argv[0] in ("setup", "config"):
         return _main_dev_subcommands()
 
     # Default: workspace mode
     return _main_dev_workspace()
 
 
-def _main_dev_subcommands() -> int:
-    """Handle setup and config subcommands."""
-    parser = argparse.ArgumentParser(
-        prog="amplifier-dev",
-        description="Amplifier development workspace manager.",
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Setup subcommand
+def _add_setup_parser(subparsers) -> None:
+    """Add the setup subcommand parser."""
     setup_parser = subparsers.add_parser(
         "setup",
         help="First-time setup: install dependencies and create configs",
@@ -277,21 +451,22 @@ def _main_dev_subcommands() -> int:
         help="Skip tmux.conf creation",
     )
 
-    # Config subcommand
-    config_parser = subparsers.add_parser(
-        "config",
-        help="View and modify configuration",
-    )
-    config_subparsers = config_parser.add_subparsers(
-        dest="config_command", help="Config commands"
-    )
 
+def _add_config_show_parser(config_subparsers) -> None:
     config_subparsers.add_parser("show", help="Show current configuration")
+
+
+def _add_config_tmux_on_parser(config_subparsers) -> None:
     config_subparsers.add_parser("tmux-on", help="Enable tmux mode")
+
+
+def _add_config_tmux_off_parser(config_subparsers) -> None:
     config_subparsers.add_parser(
         "tmux-off", help="Disable tmux mode (run amplifier directly)"
     )
 
+
+def _add_config_get_parser(config_subparsers) -> None:
     get_parser = config_subparsers.add_parser(
         "get", help="Get a configuration value (supports dot notation)"
     )
@@ -300,6 +475,8 @@ def _main_dev_subcommands() -> int:
         help="Setting key (e.g., dev.use_tmux, dev.repos, dev.windows.git)",
     )
 
+
+def _add_config_set_parser(config_subparsers) -> None:
     set_parser = config_subparsers.add_parser(
         "set", help="Set a scalar or dict entry value"
     )
@@ -309,6 +486,8 @@ def _main_dev_subcommands() -> int:
     )
     set_parser.add_argument("value", help="Value to set")
 
+
+def _add_config_add_parser(config_subparsers) -> None:
     add_parser = config_subparsers.add_parser(
         "add", help="Add to a list or dict setting"
     )
@@ -321,6 +500,8 @@ def _main_dev_subcommands() -> int:
         help="Value to add (for dicts: 'key=value' format or use full key path)",
     )
 
+
+def _add_config_remove_parser(config_subparsers) -> None:
     remove_parser = config_subparsers.add_parser(
         "remove", help="Remove from a list or dict setting"
     )
@@ -335,6 +516,8 @@ def _main_dev_subcommands() -> int:
         help="For lists: value or index to remove. For dicts: omit if key path includes entry name",
     )
 
+
+def _add_config_reset_parser(config_subparsers) -> None:
     reset_parser = config_subparsers.add_parser(
         "reset", help="Reset setting(s) to default values"
     )
@@ -345,7 +528,87 @@ def _main_dev_subcommands() -> int:
         help="Setting key to reset (omit to reset all settings)",
     )
 
-    args = parser.parse_args()
+
+# Parsers built so far in this process, keyed by what they were built for
+_parser_cache: dict[tuple, argparse.ArgumentParser] = {}
+
+# Builders for the config subcommands, in the order they appear in --help
+_CONFIG_PARSER_BUILDERS = {
+    "show": _add_config_show_parser,
+    "tmux-on": _add_config_tmux_on_parser,
+    "tmux-off": _add_config_tmux_off_parser,
+    "get": _add_config_get_parser,
+    "set": _add_config_set_parser,
+    "add": _add_config_add_parser,
+    "remove": _add_config_remove_parser,
+    "reset": _add_config_reset_parser,
+}
+
+
+def _build_subcommands_parser(argv: list[str]) -> argparse.ArgumentParser:
+    """Build the setup/config parser, only as far as argv needs it.
+
+    Both top-level subcommands are always registered, so usage and error
+    messages are the same whichever one was given. For config, the
+    requested config command (argv[1]) is sniffed up front so only its
+    parser is constructed. When the config command is missing or unknown
+    (e.g. 'config -h'), every config parser is built so help and error
+    messages list all choices.
+
+    Parsers are cached per config command, so repeated calls in one
+    process reuse them.
+    """
+    config_command = argv[1] if argv[:1] == ["config"] and len(argv) > 1 else None
+    if config_command not in _CONFIG_PARSER_BUILDERS:
+        config_command = None
+
+    cache_key = ("subcommands", config_command)
+    parser = _parser_cache.get(cache_key)
+    if parser is not None:
+        return parser
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="amplifier-dev",
+        description=_DESCRIPTION,
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    _add_setup_parser(subparsers)
+    config_parser = subparsers.add_parser(
+        "config",
+        help="View and modify configuration",
+    )
+    config_subparsers = config_parser.add_subparsers(
+        dest="config_command", help="Config commands"
+    )
+    if config_command is not None:
+        _CONFIG_PARSER_BUILDERS[config_command](config_subparsers)
+    else:
+        for builder in _CONFIG_PARSER_BUILDERS.values():
+            builder(config_subparsers)
+
+    _parser_cache[cache_key] = parser
+    return parser
+
+
+def _main_dev_subcommands() -> int:
+    """Handle setup and config subcommands."""
+    argv = sys.argv[1:]
+
+    # Config commands without arguments need no parser at all
+    if argv[0] == "config" and len(argv) <= 2:
+        config_command = argv[1] if len(argv) == 2 else None
+        if config_command in _BARE_CONFIG_COMMANDS:
+            from types import SimpleNamespace
+
+            return _cmd_config(
+                SimpleNamespace(command="config", config_command=config_command)
+            )
+
+    parser = _build_subcommands_parser(argv)
+    args = parser.parse_args(argv)
 
     if args.command == "setup":
         return _cmd_setup(args)
@@ -356,31 +619,24 @@ def _main_dev_subcommands() -> int:
         return 0
 
 
-def _main_dev_workspace() -> int:
-    """Handle the default workspace creation command."""
+def _build_workspace_parser() -> argparse.ArgumentParser:
+    """Build (or reuse) the parser for the default workspace command."""
+    parser = _parser_cache.get(("workspace",))
+    if parser is not None:
+        return parser
+
+    import argparse
+    from pathlib import Path
+
     parser = argparse.ArgumentParser(
         prog="amplifier-dev",
-        description="Amplifier development workspace manager.",
-        epilog="""
-Subcommands:
-  setup              First-time setup: install dependencies and create configs
-  config             View and modify configuration
-
-Examples:
-  amplifier-dev ~/myproject            Create/attach to workspace
-  amplifier-dev -k ~/myproject         Kill session (keep files)
-  amplifier-dev -f ~/myproject         Kill session and start fresh
-  amplifier-dev -d ~/myproject         Destroy workspace (with confirmation)
-  amplifier-dev --no-tmux ~/myproject  Run without tmux
-  amplifier-dev setup                  First-time setup
-  amplifier-dev config show            Show configuration
-""",
+        description=_DESCRIPTION,
+        epilog=_WORKSPACE_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
         "workdir",
         metavar="WORKDIR",
-        type=Path,
         nargs="?",
         help="Directory for workspace (required for create/destroy)",
     )
@@ -436,12 +692,105 @@ Examples:
         dest="use_tmux",
         help="Run amplifier directly without tmux (override config)",
     )
+    parser.add_argument(
+        "-V",
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+    _parser_cache[("workspace",)] = parser
+    return parser
+
+
+# Workspace flags understood by _fast_parse_workspace: option -> (dest, value)
+_WORKSPACE_SWITCHES = {
+    "-k": ("kill", True),
+    "--kill": ("kill", True),
+    "-f": ("fresh", True),
+    "--fresh": ("fresh", True),
+    "-d": ("destroy", True),
+    "--destroy": ("destroy", True),
+    "--tmux": ("use_tmux", True),
+    "--no-tmux": ("use_tmux", False),
+}
+_WORKSPACE_VALUE_OPTIONS = {
+    "-p": "prompt",
+    "--prompt": "prompt",
+    "-e": "extra",
+    "--extra": "extra",
+    "-c": "config",
+    "--config": "config",
+}
+
+
+def _fast_parse_workspace(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the common workspace command line without argparse.
+
+    Handles the plain spellings of the workspace flags and a single
+    WORKDIR, producing the same attributes as _build_workspace_parser().
+    Anything else (help, abbreviations, '--opt=value', grouped short
+    flags, conflicting tmux flags, missing WORKDIR, ...) returns None so
+    the caller falls back to argparse for full behavior and messages.
 
-    args = parser.parse_args()
+    Args:
+        argv: Command-line arguments, excluding the program name.
 
-    # If no workdir provided, show help
-    if args.workdir is None:
-        parser.print_help()
-        return 0
+    Returns:
+        Parsed arguments, or None if argparse should handle argv.
+    """
+    values: dict = {
+        "workdir": None,
+        "kill": False,
+        "fresh": False,
+        "destroy": False,
+        "prompt": None,
+        "extra": None,
+        "config": None,
+        "use_tmux": None,
+    }
+    tmux_flag = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg in _WORKSPACE_SWITCHES:
+            dest, value = _WORKSPACE_SWITCHES[arg]
+            if dest == "use_tmux":
+                if tmux_flag not in (None, arg):
+                    return None
+                tmux_flag = arg
+            values[dest] = value
+        elif arg in _WORKSPACE_VALUE_OPTIONS:
+            if i >= len(argv) or argv[i].startswith("-"):
+                return None
+            values[_WORKSPACE_VALUE_OPTIONS[arg]] = argv[i]
+            i += 1
+        elif arg.startswith("-") or values["workdir"] is not None:
+            return None
+        else:
+            values["workdir"] = arg
+
+    if values["workdir"] is None:
+        return None
+    if values["config"] is not None:
+        from pathlib import Path
+
+        values["config"] = Path(values["config"])
+    from types import SimpleNamespace
+
+    return SimpleNamespace(**values)
+
+
+def _main_dev_workspace() -> int:
+    """Handle the default workspace creation command."""
+    args = _fast_parse_workspace(sys.argv[1:])
+    if args is None:
+        parser = _build_workspace_parser()
+        args = parser.parse_args()
+
+        # If no workdir provided, show help
+        if args.workdir is None:
+            parser.print_help()
+            return 0
 
     return _cmd_run(args)
@@ -16,6 +16,7 @@ repos = [
 main_command = "amplifier run --mode chat"
 default_prompt = ""
 agents_template = ""  # Path to custom template, empty = use built-in
+clone_filter = "blob:none"  # git clone --filter spec, empty = full clone
 
 [dev.windows]
 shell = ""        # Empty = shell only (no command)
@@ -28,19 +29,40 @@ Usage
     >>> from amplifier_cli_tools.config import load_config
     >>> config = load_config()
     >>> config.dev.repos
-    ['https://github.com/microsoft/amplifier.git', ...]
+    ('https://github.com/microsoft/amplifier.git', ...)
 """
 
 from dataclasses import dataclass
-from importlib import resources
+from functools import lru_cache
 from pathlib import Path
-import tomllib
+import os
 
 
 DEFAULT_CONFIG_PATH = Path.home() / ".amplifier-cli-tools.toml"
 
 
-@dataclass
+# Keys of the [dev] table that map onto DevConfig fields
+_DEV_FIELDS = frozenset(
+    (
+        "use_tmux",
+        "repos",
+        "main_command",
+        "default_prompt",
+        "agents_template",
+        "bundle",
+        "clone_filter",
+        "windows",
+    )
+)
+
+# Parsed config files: path -> ((st_mtime_ns, st_size), data)
+_toml_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+# Built configs: path -> (parsed data they were built from, config)
+_config_cache: dict[Path, tuple[dict, "Config"]] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class WindowConfig:
     """Configuration for a tmux window.
 
@@ -53,30 +75,32 @@ class WindowConfig:
     command: str  # Empty string = shell only (no command)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DevConfig:
     """Configuration for the 'dev' command.
 
     Attributes:
         use_tmux: Whether to use tmux (False = run amplifier directly)
-        repos: List of git repository URLs to clone
+        repos: Git repository URLs to clone
         main_command: Command to run in the main window
         default_prompt: Default prompt to send after main_command starts
         agents_template: Path to custom AGENTS.md template, empty = use built-in
         bundle: Bundle name to use in .amplifier/settings.yaml (default: amplifier-dev)
-        windows: List of additional tmux windows to create
+        clone_filter: `git clone --filter` spec for submodules, empty = full clone
+        windows: Additional tmux windows to create
     """
 
     use_tmux: bool
-    repos: list[str]
+    repos: tuple[str, ...]
     main_command: str
     default_prompt: str
     agents_template: str  # Path to custom template, empty = use built-in
     bundle: str  # Bundle name for .amplifier/settings.yaml
-    windows: list[WindowConfig]
+    clone_filter: str  # git clone --filter spec, empty = full clone
+    windows: tuple[WindowConfig, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Root configuration object.
 
@@ -87,12 +111,21 @@ class Config:
     dev: DevConfig
 
 
+@lru_cache(maxsize=1)
 def _load_bundled_defaults() -> dict:
     """Load default configuration from bundled template file.
 
+    The template is read and parsed once per process.
+
     Returns:
-        Parsed TOML data as dict, or empty dict if template not found.
+        Parsed TOML data as dict (shared - don't mutate), or empty dict
+        if template not found.
     """
+    # Imported here so importing this module doesn't load the TOML parser
+    # or importlib.resources until config is actually read.
+    from importlib import resources
+    import tomllib
+
     try:
         template_bytes = (
             resources.files(__package__)
@@ -112,24 +145,26 @@ def _get_hardcoded_fallback() -> Config:
     return Config(
         dev=DevConfig(
             use_tmux=True,
-            repos=[
+            repos=(
                 "https://github.com/microsoft/amplifier.git",
                 "https://github.com/microsoft/amplifier-core.git",
                 "https://github.com/microsoft/amplifier-foundation.git",
-            ],
+            ),
             main_command="amplifier run --mode chat",
             default_prompt="",
             agents_template="",
             bundle="amplifier-dev",
-            windows=[
+            clone_filter="blob:none",
+            windows=(
                 WindowConfig(name="shell", command=""),
                 WindowConfig(name="git", command="lazygit"),
                 WindowConfig(name="files", command="mc"),
-            ],
+            ),
         ),
     )
 
 
+@lru_cache(maxsize=1)
 def get_default_config() -> Config:
     """Return default configuration from bundled template.
 
@@ -137,6 +172,9 @@ def get_default_config() -> Config:
     single source of truth for default values. Falls back to hardcoded
     values only if the template can't be loaded.
 
+    The result is built once per process and shared; Config is immutable,
+    so callers can't modify each other's defaults.
+
     Returns:
         Config with default settings from bundled template.
     """
@@ -152,26 +190,29 @@ def get_default_config() -> Config:
     return Config(
         dev=DevConfig(
             use_tmux=dev_data.get("use_tmux", True),
-            repos=dev_data.get("repos", []),
+            repos=tuple(dev_data.get("repos", ())),
             main_command=dev_data.get("main_command", ""),
             default_prompt=dev_data.get("default_prompt", ""),
             agents_template=dev_data.get("agents_template", ""),
             bundle=dev_data.get("bundle", "amplifier-dev"),
+            clone_filter=dev_data.get("clone_filter", "blob:none"),
             windows=_parse_windows(dev_data.get("windows", {})),
         ),
     )
 
 
-def _parse_windows(windows_dict: dict[str, str]) -> list[WindowConfig]:
-    """Convert windows dict from TOML to list of WindowConfig.
+def _parse_windows(windows_dict: dict[str, str]) -> tuple[WindowConfig, ...]:
+    """Convert windows dict from TOML to a tuple of WindowConfig.
 
     Args:
         windows_dict: Dict mapping window name to command
 
     Returns:
-        List of WindowConfig objects
+        Tuple of WindowConfig objects
     """
-    return [WindowConfig(name=name, command=cmd) for name, cmd in windows_dict.items()]
+    return tuple(
+        WindowConfig(name=name, command=cmd) for name, cmd in windows_dict.items()
+    )
 
 
 def _expand_path(path_str: str) -> str:
@@ -183,11 +224,58 @@ def _expand_path(path_str: str) -> str:
     Returns:
         Expanded path string, or empty string if input was empty
     """
-    if not path_str:
+    # Only a leading ~ is expanded, so skip Path entirely otherwise
+    if not path_str.startswith("~"):
         return path_str
     return str(Path(path_str).expanduser())
 
 
+def _read_toml_cached(path: Path) -> dict | None:
+    """Parse a TOML file, reusing the previous parse while it is unchanged.
+
+    The cache is keyed on the file's mtime and size, so edits made by
+    config_manager (or by hand) are picked up on the next call.
+
+    Args:
+        path: Path to the TOML file.
+
+    Returns:
+        Parsed TOML data (shared - don't mutate), or None if the file
+        doesn't exist.
+    """
+    import tomllib
+
+    # Open first and stat the open descriptor: one fewer path lookup, and
+    # the cache key always describes the file that is actually read.
+    # Raw fd I/O: config files are small, so the size from fstat lets the
+    # whole file come back from a single read() with no buffered reader.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+
+    try:
+        st = os.fstat(fd)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _toml_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        chunks = []
+        while chunk := os.read(fd, max(st.st_size, 4096)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    data = tomllib.loads(b"".join(chunks).decode())
+    _toml_cache[path] = (key, data)
+    return data
+
+
+def _forget_toml_cache(path: Path) -> None:
+    """Drop the cached parse of path, e.g. after rewriting the file."""
+    _toml_cache.pop(path, None)
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """Load config from file, merging with defaults.
 
@@ -195,39 +283,49 @@ def load_config(config_path: Path | None = None) -> Config:
         config_path: Optional path to config file. If None, uses
             ~/.amplifier-cli-tools.toml
 
+    Repeated calls for an unchanged file return the same (immutable)
+    Config object.
+
     Returns:
         Config object with file values overriding defaults.
         If config file doesn't exist, returns defaults.
     """
-    defaults = get_default_config()
-
     # Determine config file path
     path = config_path if config_path is not None else DEFAULT_CONFIG_PATH
 
-    # If file doesn't exist, return defaults
-    if not path.exists():
-        return defaults
+    # Load TOML file (None if it doesn't exist)
+    data = _read_toml_cached(path)
+    if data is None:
+        return get_default_config()
 
-    # Load TOML file
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
+    # Config is immutable, so the one built from this exact parse is reusable
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] is data:
+        return cached[1]
 
-    # Merge dev section
+    # Merge dev section; the bundled defaults are only consulted when the
+    # file leaves at least one field unset
     dev_data = data.get("dev", {})
+    defaults = None if _DEV_FIELDS <= dev_data.keys() else get_default_config().dev
+
+    def field(name: str):
+        return dev_data[name] if name in dev_data else getattr(defaults, name)
+
     dev_config = DevConfig(
-        use_tmux=dev_data.get("use_tmux", defaults.dev.use_tmux),
-        repos=dev_data.get("repos", defaults.dev.repos),
-        main_command=dev_data.get("main_command", defaults.dev.main_command),
-        default_prompt=dev_data.get("default_prompt", defaults.dev.default_prompt),
-        agents_template=_expand_path(
-            dev_data.get("agents_template", defaults.dev.agents_template)
-        ),
-        bundle=dev_data.get("bundle", defaults.dev.bundle),
+        use_tmux=field("use_tmux"),
+        repos=tuple(field("repos")),
+        main_command=field("main_command"),
+        default_prompt=field("default_prompt"),
+        agents_template=_expand_path(field("agents_template")),
+        bundle=field("bundle"),
+        clone_filter=field("clone_filter"),
         windows=(
             _parse_windows(dev_data["windows"])
             if "windows" in dev_data
-            else defaults.dev.windows
+            else defaults.windows
         ),
     )
 
-    return Config(dev=dev_config)
+    config = Config(dev=dev_config)
+    _config_cache[path] = (data, config)
+    return config
@@ -3,11 +3,20 @@
 Provides utilities for reading, writing, and modifying the user's config file.
 """
 
+from contextlib import contextmanager, suppress
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
-import tomllib
+import os
 
-from .config import DEFAULT_CONFIG_PATH, get_default_config
+from .config import (
+    DEFAULT_CONFIG_PATH,
+    _forget_toml_cache,
+    _load_bundled_defaults,
+    _read_toml_cached,
+    get_default_config,
+    load_config,
+)
 
 
 def get_config_path() -> Path:
@@ -21,11 +30,24 @@ def config_exists() -> bool:
 
 
 def read_config_raw() -> dict:
-    """Read raw config as dict, or empty dict if not exists."""
-    if not DEFAULT_CONFIG_PATH.exists():
+    """Read raw config as dict, or empty dict if not exists.
+    
+    The parse is shared with load_config and reused until the file changes;
+    the returned dict is a private copy that the caller may modify.
+    """
+    data = _read_toml_cached(DEFAULT_CONFIG_PATH)
+    if data is None:
         return {}
-    with open(DEFAULT_CONFIG_PATH, "rb") as f:
-        return tomllib.load(f)
+    return _copy_toml(data)
+
+
+def _copy_toml(value):
+    """Copy the tables and arrays of parsed TOML; other values are immutable."""
+    if type(value) is dict:
+        return {k: _copy_toml(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_toml(v) for v in value]
+    return value
 
 
 def write_config_raw(data: dict) -> None:
@@ -33,8 +55,50 @@ def write_config_raw(data: dict) -> None:
     
     Note: This is a simple writer that handles the common cases.
     For complex configs, consider using tomlkit for round-trip preservation.
+    
+    The file is replaced atomically, so an interrupted write never leaves
+    a truncated config behind.
     """
-    lines = []
+    payload = "".join(_toml_lines(data)).encode("utf-8")
+    _atomic_write_bytes(DEFAULT_CONFIG_PATH, payload)
+    # Don't trust mtime/size alone to notice a rewrite within the same tick
+    _forget_toml_cache(DEFAULT_CONFIG_PATH)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace the contents of path with data via a temp file and rename.
+    
+    A symlinked path is followed so the link itself is preserved, and an
+    existing file keeps its permissions.
+    """
+    target = os.path.realpath(path)
+    try:
+        mode = os.stat(target).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    
+    tmp = f"{target}.{os.getpid()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, target)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _toml_lines(data: dict):
+    """Yield the TOML text for data as newline-terminated lines."""
+    separator = ""  # Blank line between tables, none before the first
     
     # Write top-level sections
     for section, values in data.items():
@@ -50,39 +114,63 @@ def write_config_raw(data: dict) -> None:
                     flat_values[key] = val
             
             # Write section header and flat values
-            lines.append(f"[{section}]")
+            yield f"{separator}[{section}]\n"
+            separator = "\n"
             for key, val in flat_values.items():
-                lines.append(f"{key} = {_toml_value(val)}")
-            lines.append("")
+                yield f"{key} = {_toml_value(val)}\n"
             
             # Write nested sections
             for nested_name, nested_values in nested_sections.items():
-                lines.append(f"[{section}.{nested_name}]")
+                yield f"\n[{section}.{nested_name}]\n"
                 for key, val in nested_values.items():
-                    lines.append(f"{key} = {_toml_value(val)}")
-                lines.append("")
+                    yield f"{key} = {_toml_value(val)}\n"
         else:
             # Top-level value (unusual but supported)
-            lines.append(f"{section} = {_toml_value(values)}")
-    
-    DEFAULT_CONFIG_PATH.write_text("\n".join(lines))
+            yield f"{section} = {_toml_value(values)}\n"
+
+
+# Escapes for TOML basic strings, applied in a single str.translate pass
+_TOML_STR_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _toml_str(val: str) -> str:
+    # Escape and quote strings
+    return f'"{val.translate(_TOML_STR_ESCAPES)}"'
+
+
+def _toml_bool(val: bool) -> str:
+    return "true" if val else "false"
+
+
+def _toml_list(val: list) -> str:
+    items = ", ".join(_toml_value(v) for v in val)
+    return f"[{items}]"
+
+
+# Formatter per exact value type; strings first as they're the most common.
+# bool gets its own entry, so it never reaches the int formatter.
+_TOML_FORMATTERS = {
+    str: _toml_str,
+    bool: _toml_bool,
+    int: str,
+    float: str,
+    list: _toml_list,
+    tuple: _toml_list,
+}
 
 
 def _toml_value(val) -> str:
     """Convert Python value to TOML string representation."""
-    if isinstance(val, bool):
-        return "true" if val else "false"
-    elif isinstance(val, str):
-        # Escape and quote strings
-        escaped = val.replace("\\", "\\\\").replace('"', '\\"')
-        return f'"{escaped}"'
-    elif isinstance(val, (int, float)):
-        return str(val)
-    elif isinstance(val, list):
-        items = ", ".join(_toml_value(v) for v in val)
-        return f"[{items}]"
-    else:
-        return str(val)
+    formatter = _TOML_FORMATTERS.get(type(val))
+    if formatter is not None:
+        return formatter(val)
+    # Subclasses of the supported types (rare) still format like their base
+    for base, formatter in _TOML_FORMATTERS.items():
+        if isinstance(val, base):
+            return formatter(val)
+    return str(val)
 
 
 def get_setting(section: str, key: str, default=None):
@@ -96,11 +184,15 @@ def get_setting(section: str, key: str, default=None):
     Returns:
         Setting value or default
     """
-    config = read_config_raw()
-    return config.get(section, {}).get(key, default)
+    # Read the shared parse directly; only the value handed out is copied
+    config = _read_toml_cached(DEFAULT_CONFIG_PATH) or {}
+    section_data = config.get(section, {})
+    if key not in section_data:
+        return default
+    return _copy_toml(section_data[key])
 
 
-def set_setting(section: str, key: str, value) -> None:
+def set_setting(section: str, key: str, value) -> bool:
     """Set a specific setting value.
     
     Creates the config file if it doesn't exist.
@@ -109,38 +201,28 @@ def set_setting(section: str, key: str, value) -> None:
         section: Config section (e.g., "dev", "reset")
         key: Setting key within section
         value: Value to set
+        
+    Returns:
+        False if the config file already had that value (nothing written)
     """
-    from importlib import resources
-    
     # If config doesn't exist, start with defaults
-    if not config_exists():
-        try:
-            template_bytes = (
-                resources.files("amplifier_cli_tools")
-                .joinpath("templates", "default-config.toml")
-                .read_bytes()
-            )
-            config = tomllib.loads(template_bytes.decode("utf-8"))
-        except Exception:
-            config = {}
-    else:
-        config = read_config_raw()
+    config = _read_config_for_update()
     
     # Ensure section exists
-    if section not in config:
-        config[section] = {}
+    sec = config.setdefault(section, {})
+    if _is_unchanged(config, sec, key, value):
+        return False
     
     # Set the value
-    config[section][key] = value
+    sec[key] = value
     
     # Write back
-    write_config_raw(config)
+    _write_config_for_update(config)
+    return True
 
 
 def show_config() -> str:
     """Return formatted display of current configuration."""
-    from .config import load_config
-    
     config = load_config()
     defaults = get_default_config()
     
@@ -162,6 +244,28 @@ def show_config() -> str:
     return "\n".join(lines)
 
 
+# How get_nested_setting/reset_setting read each [dev] setting off a DevConfig,
+# in the form it's stored in the config file. windows is handled separately:
+# it's a WindowConfig tuple but stored (and addressable) as a dict.
+_DEV_SETTINGS = {
+    "use_tmux": attrgetter("use_tmux"),
+    "main_command": attrgetter("main_command"),
+    "default_prompt": attrgetter("default_prompt"),
+    "agents_template": attrgetter("agents_template"),
+    "bundle": attrgetter("bundle"),
+    "clone_filter": attrgetter("clone_filter"),
+    "repos": lambda dev: list(dev.repos),
+}
+
+
+def _window_command(windows, name: str) -> str | None:
+    """Return the command of the window called name, or None."""
+    for w in windows:
+        if w.name == name:
+            return w.command
+    return None
+
+
 def _parse_key(key: str) -> tuple[str, str, str | None]:
     """Parse dot-notation key into components.
     
@@ -177,15 +281,14 @@ def _parse_key(key: str) -> tuple[str, str, str | None]:
     Raises:
         ValueError: If key format is invalid
     """
-    parts = key.split(".")
-    if len(parts) < 2:
+    section, sep, rest = key.partition(".")
+    if not sep:
         raise ValueError(f"Invalid key format: '{key}'. Use 'section.key' (e.g., 'dev.use_tmux')")
     
-    section = parts[0]
-    setting = parts[1]
-    nested_key = ".".join(parts[2:]) if len(parts) > 2 else None
+    # Anything after the second dot is the nested key, dots included
+    setting, sep, nested_key = rest.partition(".")
     
-    return section, setting, nested_key
+    return section, setting, nested_key if sep else None
 
 
 def get_nested_setting(key: str) -> Any:
@@ -205,8 +308,6 @@ def get_nested_setting(key: str) -> Any:
         >>> get_nested_setting('dev.windows.git')
         'lazygit'
     """
-    from .config import load_config
-    
     section, setting, nested_key = _parse_key(key)
     
     # Use load_config which merges with defaults
@@ -214,62 +315,71 @@ def get_nested_setting(key: str) -> Any:
     
     if section == "dev":
         dev = config.dev
-        if setting == "use_tmux":
-            return dev.use_tmux
-        elif setting == "main_command":
-            return dev.main_command
-        elif setting == "default_prompt":
-            return dev.default_prompt
-        elif setting == "agents_template":
-            return dev.agents_template
-        elif setting == "bundle":
-            return dev.bundle
-        elif setting == "repos":
-            return dev.repos
+        getter = _DEV_SETTINGS.get(setting)
+        if getter is not None:
+            return getter(dev)
         elif setting == "windows":
-            # Convert WindowConfig list to dict
-            windows_dict = {w.name: w.command for w in dev.windows}
             if nested_key:
-                return windows_dict.get(nested_key)
-            return windows_dict
+                return _window_command(dev.windows, nested_key)
+            # Convert WindowConfig tuple to dict
+            return {w.name: w.command for w in dev.windows}
     
     return None
 
 
-def set_nested_setting(key: str, value: Any) -> None:
+def _is_unchanged(config: dict, table: dict, name: str, value: Any) -> bool:
+    """Whether setting table[name] = value would leave the config file as is.
+    
+    Types must match too (True == 1, but they're written differently). A
+    config freshly seeded from the template doesn't count as unchanged:
+    writing it is what creates the file.
+    """
+    if name not in table:
+        return False
+    current = table[name]
+    if type(current) is not type(value) or current != value:
+        return False
+    return config is _batch_config or type(config) is not _SeededConfig
+
+
+def set_nested_setting(key: str, value: Any) -> bool:
     """Set setting by dot-notation key.
     
     Args:
         key: Key like 'dev.use_tmux' or 'dev.windows.git'
         value: Value to set
         
+    Returns:
+        False if the config file already had that value (nothing written)
+        
     Examples:
         >>> set_nested_setting('dev.use_tmux', False)
         >>> set_nested_setting('dev.windows.git', 'tig')
     """
     section, setting, nested_key = _parse_key(key)
     
-    # Load or create config
-    if not config_exists():
-        _initialize_config()
-    config = read_config_raw()
+    # Load config (or defaults, if it doesn't exist yet)
+    config = _read_config_for_update()
     
     # Ensure section exists
-    if section not in config:
-        config[section] = {}
+    sec = config.setdefault(section, {})
     
     if nested_key is not None:
         # Setting a nested key (e.g., dev.windows.git)
-        if setting not in config[section]:
-            config[section][setting] = {}
-        if not isinstance(config[section][setting], dict):
+        table = sec.setdefault(setting, {})
+        if not isinstance(table, dict):
             raise ValueError(f"Cannot set nested key: '{section}.{setting}' is not a dict")
-        config[section][setting][nested_key] = value
+        name = nested_key
     else:
         # Setting a top-level key in section
-        config[section][setting] = value
+        table, name = sec, setting
+    
+    if _is_unchanged(config, table, name, value):
+        return False
     
-    write_config_raw(config)
+    table[name] = value
+    _write_config_for_update(config)
+    return True
 
 
 def add_to_setting(key: str, value: str) -> str:
@@ -293,18 +403,12 @@ def add_to_setting(key: str, value: str) -> str:
     """
     section, setting, nested_key = _parse_key(key)
     
-    if not config_exists():
-        _initialize_config()
-    config = read_config_raw()
-    
-    if section not in config:
-        config[section] = {}
+    config = _read_config_for_update()
+    sec = config.setdefault(section, {})
+    current = sec.get(setting)
     
-    current = config[section].get(setting)
-    
-    # If setting doesn't exist, check defaults to determine type
+    # If setting doesn't exist, determine type from the setting name
     if current is None:
-        defaults = get_default_config()
         if section == "dev":
             if setting == "repos":
                 current = []
@@ -324,29 +428,32 @@ def add_to_setting(key: str, value: str) -> str:
         if value in current:
             return f"Value already exists in {key}"
         current.append(value)
-        config[section][setting] = current
-        write_config_raw(config)
+        sec[setting] = current
+        _write_config_for_update(config)
         return f"Added to {key}"
     
     # Handle dict
     if isinstance(current, dict):
         if nested_key:
             # Key provided: dev.windows.git = value
-            if setting not in config[section]:
-                config[section][setting] = {}
-            config[section][setting][nested_key] = value
-            write_config_raw(config)
+            if current.get(nested_key) == value:
+                return f"Value already exists in {key}"
+            current[nested_key] = value
+            sec[setting] = current
+            _write_config_for_update(config)
             return f"Added {section}.{setting}.{nested_key}"
         else:
             # No nested key, expect key=value format
             if "=" not in value:
                 raise ValueError(f"'{section}.{setting}' is a dict. Use 'key=value' format or specify full key like '{section}.{setting}.name'")
             k, v = value.split("=", 1)
-            if setting not in config[section]:
-                config[section][setting] = {}
-            config[section][setting][k.strip()] = v.strip()
-            write_config_raw(config)
-            return f"Added {section}.{setting}.{k.strip()}"
+            k, v = k.strip(), v.strip()
+            if current.get(k) == v:
+                return f"Value already exists in {section}.{setting}.{k}"
+            current[k] = v
+            sec[setting] = current
+            _write_config_for_update(config)
+            return f"Added {section}.{setting}.{k}"
     
     raise ValueError(f"'{key}' is not a list or dict (type: {type(current).__name__})")
 
@@ -375,16 +482,14 @@ def remove_from_setting(key: str, value: str | None = None) -> str:
     """
     section, setting, nested_key = _parse_key(key)
     
-    if not config_exists():
+    config = _read_config_for_update(seed=False)
+    if config is None:
         raise ValueError("No config file exists")
     
-    config = read_config_raw()
-    
-    if section not in config or setting not in config[section]:
+    current = config.get(section, {}).get(setting)
+    if current is None:
         raise ValueError(f"Setting '{section}.{setting}' not found")
     
-    current = config[section][setting]
-    
     # Remove from dict by nested key
     if nested_key is not None:
         if not isinstance(current, dict):
@@ -392,7 +497,7 @@ def remove_from_setting(key: str, value: str | None = None) -> str:
         if nested_key not in current:
             raise ValueError(f"Key '{nested_key}' not found in {section}.{setting}")
         del current[nested_key]
-        write_config_raw(config)
+        _write_config_for_update(config)
         return f"Removed {key}"
     
     # Remove from list
@@ -400,20 +505,22 @@ def remove_from_setting(key: str, value: str | None = None) -> str:
         if value is None:
             raise ValueError(f"'{key}' is a list. Specify value or index to remove.")
         
-        # Try as index first
+        # Try as index first (isdigit() rules out negative indexes)
         if value.isdigit():
             idx = int(value)
-            if idx < 0 or idx >= len(current):
-                raise ValueError(f"Index {idx} out of range (list has {len(current)} items)")
-            removed = current.pop(idx)
-            write_config_raw(config)
+            try:
+                removed = current.pop(idx)
+            except IndexError:
+                raise ValueError(f"Index {idx} out of range (list has {len(current)} items)") from None
+            _write_config_for_update(config)
             return f"Removed from {key}: {removed}"
         
-        # Try as value
-        if value not in current:
-            raise ValueError(f"Value '{value}' not found in {key}")
-        current.remove(value)
-        write_config_raw(config)
+        # Try as value - remove() does the membership scan itself
+        try:
+            current.remove(value)
+        except ValueError:
+            raise ValueError(f"Value '{value}' not found in {key}") from None
+        _write_config_for_update(config)
         return f"Removed from {key}"
     
     # Remove dict key via value parameter
@@ -423,7 +530,7 @@ def remove_from_setting(key: str, value: str | None = None) -> str:
         if value not in current:
             raise ValueError(f"Key '{value}' not found in {key}")
         del current[value]
-        write_config_raw(config)
+        _write_config_for_update(config)
         return f"Removed {key}.{value}"
     
     raise ValueError(f"'{key}' is not a list or dict")
@@ -448,8 +555,12 @@ def reset_setting(key: str | None = None) -> str:
     defaults = get_default_config()
     
     if key is None:
+        if _batch_config is not None:
+            # Inside edit_config(): an empty config means all defaults
+            _batch_config.clear()
+            return "Reset all settings to defaults"
         # Reset entire config - delete file so defaults are used
-        if config_exists():
+        with suppress(FileNotFoundError):
             DEFAULT_CONFIG_PATH.unlink()
         return "Reset all settings to defaults (config file removed)"
     
@@ -458,44 +569,38 @@ def reset_setting(key: str | None = None) -> str:
     # Get default value
     if section == "dev":
         dev_defaults = defaults.dev
-        if setting == "use_tmux":
-            default_val = dev_defaults.use_tmux
-        elif setting == "repos":
-            default_val = dev_defaults.repos
-        elif setting == "main_command":
-            default_val = dev_defaults.main_command
-        elif setting == "default_prompt":
-            default_val = dev_defaults.default_prompt
-        elif setting == "agents_template":
-            default_val = dev_defaults.agents_template
-        elif setting == "bundle":
-            default_val = dev_defaults.bundle
+        getter = _DEV_SETTINGS.get(setting)
+        if getter is not None:
+            default_val = getter(dev_defaults)
         elif setting == "windows":
-            # Convert WindowConfig list to dict for storage
-            default_val = {w.name: w.command for w in dev_defaults.windows}
             if nested_key:
                 # Resetting just one window
-                window_default = default_val.get(nested_key)
+                window_default = _window_command(dev_defaults.windows, nested_key)
                 if window_default is None:
                     # Key doesn't exist in defaults - remove it
-                    config = read_config_raw()
-                    if section in config and setting in config[section] and nested_key in config[section][setting]:
-                        del config[section][setting][nested_key]
-                        write_config_raw(config)
+                    config = _read_config_for_update()
+                    table = config.get(section, {}).get(setting, {})
+                    if nested_key in table:
+                        del table[nested_key]
+                        _write_config_for_update(config)
                         return f"Removed {key} (not in defaults)"
                     return f"{key} already not set"
-                set_nested_setting(key, window_default)
+                if not set_nested_setting(key, window_default):
+                    return f"{key} already at default: {window_default!r}"
                 return f"Reset {key} to default: {window_default!r}"
+            # Convert WindowConfig tuple to dict for storage
+            default_val = {w.name: w.command for w in dev_defaults.windows}
         else:
             raise ValueError(f"Unknown setting: {key}")
     else:
         raise ValueError(f"Unknown section: {section}")
     
     # Set to default value
-    if not config_exists():
+    if _batch_config is None and not config_exists():
         return f"{key} already at default: {_format_value(default_val)}"
     
-    set_nested_setting(key, default_val)
+    if not set_nested_setting(key, default_val):
+        return f"{key} already at default: {_format_value(default_val)}"
     return f"Reset {key} to default: {_format_value(default_val)}"
 
 
@@ -512,16 +617,22 @@ def _format_value(val: Any) -> str:
     return str(val)
 
 
+def _display_str(val: str) -> str:
+    display = val if len(val) <= 50 else val[:47] + "..."
+    return f'"{display}"'
+
+
+# show_config_full's formatting for scalar values, by exact type (else str())
+_SCALAR_DISPLAY = {bool: _toml_bool, str: _display_str}
+
+
 def show_config_full() -> str:
     """Return comprehensive formatted display of ALL settings.
     
     Shows all scalars, lists, and dicts with their full values.
     """
-    from .config import load_config
-    
     config = load_config()
     defaults = get_default_config()
-    raw = read_config_raw()
     
     lines = []
     lines.append(f"Config file: {DEFAULT_CONFIG_PATH}")
@@ -538,24 +649,19 @@ def show_config_full() -> str:
         ("default_prompt", config.dev.default_prompt, defaults.dev.default_prompt),
         ("agents_template", config.dev.agents_template, defaults.dev.agents_template),
         ("bundle", config.dev.bundle, defaults.dev.bundle),
+        ("clone_filter", config.dev.clone_filter, defaults.dev.clone_filter),
     ]
     
     for name, current, default in scalars:
         marker = "" if current == default else " (customized)"
-        if isinstance(current, bool):
-            lines.append(f"  {name} = {str(current).lower()}{marker}")
-        elif isinstance(current, str):
-            display = current if len(current) <= 50 else current[:47] + "..."
-            lines.append(f'  {name} = "{display}"{marker}')
-        else:
-            lines.append(f"  {name} = {current}{marker}")
+        display = _SCALAR_DISPLAY.get(type(current), str)(current)
+        lines.append(f"  {name} = {display}{marker}")
     
     # Repos (list)
     lines.append("")
     lines.append("  repos:")
     if config.dev.repos:
-        for i, repo in enumerate(config.dev.repos):
-            lines.append(f"    [{i}] {repo}")
+        lines.extend(f"    [{i}] {repo}" for i, repo in enumerate(config.dev.repos))
     else:
         lines.append("    (empty)")
     
@@ -563,33 +669,85 @@ def show_config_full() -> str:
     lines.append("")
     lines.append("  windows:")
     if config.dev.windows:
-        for w in config.dev.windows:
-            cmd_display = w.command if w.command else "(shell only)"
-            lines.append(f"    {w.name} = {cmd_display}")
+        lines.extend(
+            f"    {w.name} = {w.command or '(shell only)'}" for w in config.dev.windows
+        )
     else:
         lines.append("    (empty)")
     
     return "\n".join(lines)
 
 
-def _initialize_config() -> None:
-    """Initialize config file from defaults if it doesn't exist."""
-    from importlib import resources
+# Config dict being modified by the active edit_config() block, if any
+_batch_config: dict | None = None
+
+
+@contextmanager
+def edit_config():
+    """Batch several changes into a single config read and write.
     
-    if config_exists():
+    Inside the block, set_setting, set_nested_setting, add_to_setting,
+    remove_from_setting and reset_setting modify the yielded dict instead
+    of the file. The file is written once, when the block exits without
+    an exception. Readers such as get_nested_setting only see the changes
+    after that write. Nested blocks join the outermost one.
+    
+    Examples:
+        >>> with edit_config():
+        ...     add_to_setting('dev.repos', 'https://github.com/example/a.git')
+        ...     add_to_setting('dev.repos', 'https://github.com/example/b.git')
+    """
+    global _batch_config
+    
+    if _batch_config is not None:
+        yield _batch_config
         return
     
+    _batch_config = _read_config_for_update()
     try:
-        template_bytes = (
-            resources.files("amplifier_cli_tools")
-            .joinpath("templates", "default-config.toml")
-            .read_bytes()
-        )
-        config = tomllib.loads(template_bytes.decode("utf-8"))
-    except Exception:
-        config = {}
+        yield _batch_config
+        write_config_raw(_batch_config)
+    finally:
+        _batch_config = None
+
+
+def _write_config_for_update(config: dict) -> None:
+    """Write back a modified config, unless edit_config() will write it."""
+    if config is not _batch_config:
+        write_config_raw(config)
+
+
+class _SeededConfig(dict):
+    """Config data seeded from the template because no config file exists.
+
+    Lets _is_unchanged tell a seeded config from one read off disk without
+    another stat of the config file.
+    """
+
+    __slots__ = ()
+
+
+def _read_config_for_update(seed: bool = True) -> dict | None:
+    """Read config for a read-modify-write, seeding from the bundled template.
+    
+    Inside edit_config() this is the batch's dict. If the config file
+    doesn't exist yet, the template's data is returned so the caller's
+    single write both creates the file and applies its change, instead of
+    writing the template first and parsing it straight back; that copy is
+    a _SeededConfig. With seed=False, a missing file gives None instead.
+    """
+    if _batch_config is not None:
+        return _batch_config
+    
+    # Opening the file doubles as the existence check - no separate stat
+    data = _read_toml_cached(DEFAULT_CONFIG_PATH)
+    if data is not None:
+        return _copy_toml(data)
+    if not seed:
+        return None
     
-    write_config_raw(config)
+    # The template is parsed once per process; copy it before it's modified
+    return _SeededConfig(_copy_toml(_load_bundled_defaults()))
 
 
 __all__ = [
@@ -606,4 +764,5 @@ __all__ = [
     "remove_from_setting",
     "reset_setting",
     "show_config_full",
+    "edit_config",
 ]
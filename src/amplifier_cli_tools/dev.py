@@ -13,19 +13,23 @@ Example:
 
 from __future__ import annotations
 
-from importlib import resources
 from pathlib import Path
 import shutil
 
 import os
 import shlex
 import sys
+from typing import TYPE_CHECKING
 
-from .config import DevConfig
-from .shell import ensure_commands, run, ShellError
+from .shell import ensure_commands, exec_command, run, ShellError
 from . import git
 from . import tmux
 
+if TYPE_CHECKING:
+    # Annotations only: commands that never read the config (--kill,
+    # --destroy) don't import the config module or resolve its path
+    from .config import DevConfig
+
 
 # Bundle to use when resuming sessions
 RESUME_BUNDLE = "amplifier-dev"
@@ -34,8 +38,8 @@ RESUME_BUNDLE = "amplifier-dev"
 def _exec_replace(cmd_parts: list[str], cwd: Path | None = None) -> None:
     """Replace current process with the given command (cross-platform).
 
-    On POSIX, uses os.execvp() to replace the process (cwd must be set
-    beforehand via os.chdir since execvp replaces the process).
+    On POSIX, uses exec_command() to replace the process (cwd must be set
+    beforehand via os.chdir since exec replaces the process).
     On Windows, uses subprocess.run() with cwd parameter to avoid changing
     the parent process's working directory, which breaks uv .exe trampolines.
     """
@@ -46,7 +50,7 @@ def _exec_replace(cmd_parts: list[str], cwd: Path | None = None) -> None:
     else:
         if cwd:
             os.chdir(cwd)
-        os.execvp(cmd_parts[0], cmd_parts)
+        exec_command(cmd_parts)
 
 
 def has_amplifier_sessions() -> bool:
@@ -58,7 +62,9 @@ def has_amplifier_sessions() -> bool:
         True if sessions exist, False if no sessions found or on error.
     """
     try:
-        result = run("amplifier session list", check=False, capture=True, quiet=True)
+        result = run(
+            ["amplifier", "session", "list"], check=False, capture=True, quiet=True
+        )
         # If output contains "No sessions found." there are no sessions
         if "No sessions found" in result.stdout:
             return False
@@ -213,13 +219,16 @@ def create_agents_md(workdir: Path, config: DevConfig) -> bool:
         else:
             print(f"Warning: Custom template not found: {custom_template}")
 
-    # Try built-in template
+    # Try built-in template (imported here: only needed for a new workspace)
+    from importlib import resources
+
+    # Copied as a file (as_file is a no-op for an installed package) so the
+    # bytes go straight across via copyfile's sendfile fast path
     try:
-        template_content = (
-            resources.files(__package__).joinpath("templates", "AGENTS.md").read_text()
-        )
+        template = resources.files(__package__).joinpath("templates", "AGENTS.md")
+        with resources.as_file(template) as template_path:
+            shutil.copyfile(template_path, agents_path)
         print("Creating AGENTS.md from built-in template")
-        agents_path.write_text(template_content)
         return True
     except (FileNotFoundError, TypeError):
         pass
@@ -267,11 +276,12 @@ def setup_workspace(workdir: Path, config: DevConfig) -> bool:
             print(f"Setting up new workspace: {workdir}")
 
             # Initialize git repo (creates directory if needed)
-            git.init_repo(workdir)
+            git.init_repo(workdir, check_existing=False)
 
-            # Add each repo as submodule
-            for repo_url in config.repos:
-                git.add_submodule(workdir, repo_url)
+            # Add each repo as submodule (cloned in parallel)
+            git.add_submodules(
+                workdir, config.repos, clone_filter=config.clone_filter
+            )
 
             # Checkout submodules to main branch and pull
             if config.repos:
@@ -348,11 +358,11 @@ def _run_amplifier_directly(
         extra: Extra text to append to prompt.
 
     Returns:
-        True (doesn't return on success due to execvp).
+        True (doesn't return on success due to exec).
     """
     print(f"Changed to: {workdir}")
 
-    # On POSIX, chdir now since execvp will replace the process.
+    # On POSIX, chdir now since exec will replace the process.
     # On Windows, we pass cwd to subprocess.run instead (changing CWD breaks
     # uv's .exe trampolines which fail to canonicalize their script path).
     if sys.platform != "win32":
@@ -364,7 +374,7 @@ def _run_amplifier_directly(
         cmd_parts = ["amplifier", "resume", "--force-bundle", RESUME_BUNDLE]
         print(f"Running: {' '.join(cmd_parts)}")
         _exec_replace(cmd_parts, cwd=workdir)
-        # execvp doesn't return on success
+        # exec doesn't return on success
         return True
 
     # No existing sessions - start a new one
@@ -386,7 +396,7 @@ def _run_amplifier_directly(
     # Replace current process with amplifier
     _exec_replace(cmd_parts, cwd=workdir)
 
-    # execvp doesn't return on success
+    # exec doesn't return on success
     return True
 
 
@@ -396,6 +406,7 @@ def run_dev(
     prompt: str | None = None,
     extra: str | None = None,
     no_tmux: bool = False,
+    has_session: bool | None = None,
 ) -> bool:
     """Main entry point for amplifier-dev workflow.
 
@@ -413,6 +424,8 @@ def run_dev(
         prompt: Override default prompt (None = use config default).
         extra: Extra text to append to prompt.
         no_tmux: If True, setup workspace only without launching tmux.
+        has_session: Whether the tmux session is known to exist, e.g. False
+            right after --fresh killed it (None = ask tmux).
 
     Returns:
         True on success, False on failure.
@@ -454,11 +467,13 @@ def run_dev(
     final_prompt = compute_final_prompt(config, prompt, extra)
 
     # Handle tmux session
-    if tmux.session_exists(session_name):
+    if has_session is None:
+        has_session = tmux.session_exists(session_name)
+    if has_session:
         print(f"Attaching to existing session: {session_name}")
         # Select the main window before attaching
         tmux.select_window(session_name, "amplifier")
-        # Note: attach_session uses execvp, so this call doesn't return
+        # Note: attach_session execs tmux, so this call doesn't return
         tmux.attach_session(session_name)
     else:
         print(f"Creating new session: {session_name}")
@@ -470,7 +485,7 @@ def run_dev(
             prompt=final_prompt,
             windows=config.windows,
         )
-        # Note: attach_session uses execvp, so this call doesn't return
+        # Note: attach_session execs tmux, so this call doesn't return
         tmux.attach_session(session_name)
 
     return True
@@ -1,10 +1,54 @@
 """Git repository and submodule operations for workspace setup."""
 
+import re
+import sys
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import TypeVar
 
 from .shell import ShellError, run
 
 
+# Maximum number of git commands (clones, pulls) run at once
+MAX_PARALLEL_JOBS = 8
+
+_T = TypeVar("_T")
+
+# Settings written into each submodule clone's config: a commit-graph kept
+# up to date by every fetch (log/merge-base walks), plus manyFiles (index v4
+# and the untracked cache, for faster status)
+_CLONE_CONFIG = ("fetch.writeCommitGraph=true", "feature.manyFiles=true")
+
+# Last path component of an HTTPS/SSH/file URL (after "/" or the SSH "host:"),
+# minus any trailing slashes and .git suffix
+_REPO_NAME_RE = re.compile(r"(?:^|[:/])([^:/]+?)(?:\.git)?/*$")
+
+
+def _run_parallel(
+    func: Callable[[_T], object], items: list[_T]
+) -> list[ShellError | None]:
+    """Call func on each item concurrently.
+
+    Returns:
+        The ShellError each call raised, or None if it succeeded, in the
+        same order as items.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def call(item: _T) -> ShellError | None:
+        try:
+            func(item)
+        except ShellError as e:
+            return e
+        return None
+
+    if not items:
+        return []
+    workers = min(MAX_PARALLEL_JOBS, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(call, items))
+
+
 def repo_name_from_url(url: str) -> str:
     """Extract repository name from URL.
 
@@ -24,16 +68,8 @@ def repo_name_from_url(url: str) -> str:
         >>> repo_name_from_url("https://github.com/org/repo")
         'repo'
     """
-    # Handle SSH format: git@host:org/repo.git
-    if ":" in url and not url.startswith(("http://", "https://")):
-        url = url.split(":")[-1]
-
-    # Get basename and strip .git suffix
-    name = Path(url).name
-    if name.endswith(".git"):
-        name = name[:-4]
-
-    return name
+    match = _REPO_NAME_RE.search(url)
+    return match.group(1) if match else url
 
 
 def is_git_repo(path: Path) -> bool:
@@ -49,7 +85,7 @@ def is_git_repo(path: Path) -> bool:
     return git_path.exists()
 
 
-def init_repo(workdir: Path) -> None:
+def init_repo(workdir: Path, *, check_existing: bool = True) -> None:
     """Initialize git repository.
 
     Creates the directory if it doesn't exist. Skips initialization
@@ -57,6 +93,8 @@ def init_repo(workdir: Path) -> None:
 
     Args:
         workdir: Directory to initialize as git repository
+        check_existing: Whether to check for an existing repository first.
+            Pass False when the caller has just checked is_git_repo itself.
 
     Raises:
         ShellError: If git init fails
@@ -65,7 +103,7 @@ def init_repo(workdir: Path) -> None:
     workdir.mkdir(parents=True, exist_ok=True)
 
     # Skip if already a git repo
-    if is_git_repo(workdir):
+    if check_existing and is_git_repo(workdir):
         print(f"Directory {workdir} is already a git repository")
         return
 
@@ -73,36 +111,102 @@ def init_repo(workdir: Path) -> None:
     run(["git", "init"], cwd=workdir)
 
 
-def add_submodule(workdir: Path, repo_url: str) -> None:
+def add_submodule(workdir: Path, repo_url: str, clone_filter: str = "") -> None:
     """Add git submodule.
 
     Extracts repository name from URL and adds as submodule.
-    Skips if submodule directory already exists.
+    Skips if submodule directory already exists. This is add_submodules
+    for a single repo.
 
     Args:
         workdir: Working directory (must be a git repository)
         repo_url: Git repository URL to add as submodule
+        clone_filter: `git clone --filter` spec, empty for a full clone
 
     Raises:
-        ShellError: If git submodule add fails
+        ShellError: If the clone or git submodule add fails
     """
-    repo_name = repo_name_from_url(repo_url)
-    submodule_path = workdir / repo_name
+    add_submodules(workdir, [repo_url], clone_filter=clone_filter)
+
 
-    # Skip if submodule directory already exists
-    if submodule_path.exists():
-        print(f"Submodule {repo_name} already exists, skipping")
+def add_submodules(
+    workdir: Path, repo_urls: Iterable[str], clone_filter: str = ""
+) -> None:
+    """Add several git submodules, cloning them in parallel.
+
+    The clones are independent and network-bound, so they run concurrently,
+    straight into their final paths. Each clone is then registered with
+    `git submodule add` (which adopts an existing checkout instead of
+    cloning again) one at a time, since they all update .gitmodules and the
+    index. `git submodule absorbgitdirs` finally moves each clone's .git
+    into .git/modules - the same layout a plain `git submodule add` gives.
+
+    Skips repos whose directory already exists. If a clone fails, the
+    others are still registered before the error is raised.
+
+    With a clone_filter such as "blob:none" the submodules are partial
+    clones: full history, but file contents outside the checkout are only
+    downloaded when a command (log -p, blame, checkout) first needs them.
+
+    Each clone is configured with _CLONE_CONFIG as it is created, so later
+    git commands in the submodules benefit without extra `git config` runs.
+
+    Args:
+        workdir: Working directory (must be a git repository)
+        repo_urls: Git repository URLs to add as submodules
+        clone_filter: `git clone --filter` spec, empty for a full clone
+
+    Raises:
+        ShellError: If a clone or git submodule add fails
+    """
+    pending = []
+    # Names already queued: a later repo with the same name (e.g. a fork)
+    # is skipped just as if the first one had already been cloned
+    queued: set[str] = set()
+    for repo_url in repo_urls:
+        repo_name = repo_name_from_url(repo_url)
+        if repo_name in queued or (workdir / repo_name).exists():
+            print(f"Submodule {repo_name} already exists, skipping")
+        else:
+            print(f"Adding submodule {repo_name}...")
+            queued.add(repo_name)
+            pending.append((repo_url, repo_name))
+
+    if not pending:
         return
 
-    print(f"Adding submodule {repo_name}...")
-    run(["git", "submodule", "add", repo_url], cwd=workdir)
+    clone_cmd = ["git", "clone"]
+    for setting in _CLONE_CONFIG:
+        clone_cmd += ["-c", setting]
+    if clone_filter:
+        clone_cmd.append(f"--filter={clone_filter}")
+
+    def clone(item: tuple[str, str]) -> None:
+        repo_url, repo_name = item
+        run([*clone_cmd, repo_url, repo_name], cwd=workdir)
+
+    errors = _run_parallel(clone, pending)
+
+    for (repo_url, repo_name), error in zip(pending, errors):
+        if error is None:
+            run(["git", "submodule", "add", repo_url, repo_name], cwd=workdir)
+    run(["git", "submodule", "absorbgitdirs"], cwd=workdir)
+
+    for error in errors:
+        if error is not None:
+            raise error
 
 
 def checkout_submodules_to_main(workdir: Path) -> None:
     """Checkout all submodules to main branch and pull latest.
 
-    Uses git submodule foreach to iterate over all submodules,
-    checkout main branch, and pull latest changes.
+    Reads the submodule paths from .gitmodules, then checks out main and
+    pulls in each submodule concurrently - the pulls are independent and
+    network-bound. The submodules have no nested submodules of their own,
+    so recursion is turned off: otherwise pull's fetch checks every
+    fetched commit for sub-submodule updates.
+
+    Every submodule is attempted; the first failure is raised afterwards.
 
     Args:
         workdir: Working directory containing submodules
@@ -111,10 +215,32 @@ def checkout_submodules_to_main(workdir: Path) -> None:
         ShellError: If git operations fail
     """
     print("Checking out submodules to main branch...")
-    run(
-        ["git", "submodule", "foreach", "git checkout main && git pull"],
-        cwd=workdir,
-    )
+    list_cmd = ["git", "config", "--file", ".gitmodules", "--get-regexp", r"\.path$"]
+    result = run(list_cmd, cwd=workdir, check=False)
+    # Exit code 1 means no matches (or no .gitmodules at all); anything else,
+    # e.g. a malformed .gitmodules, is reported like any other failed command
+    if result.returncode not in (0, 1):
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+        raise ShellError(
+            f"Command failed with exit code {result.returncode}: "
+            f"{' '.join(list_cmd)}",
+            returncode=result.returncode,
+        )
+    # Lines are "submodule.<name>.path <path>"
+    paths = [line.split(" ", 1)[1] for line in result.stdout.splitlines()]
+
+    def update(path: str) -> None:
+        submodule = workdir / path
+        run(
+            ["git", "-c", "submodule.recurse=false", "checkout", "main"],
+            cwd=submodule,
+        )
+        run(["git", "pull", "--no-recurse-submodules"], cwd=submodule)
+
+    for error in _run_parallel(update, paths):
+        if error is not None:
+            raise error
 
 
 def initial_commit(workdir: Path, message: str) -> None:
@@ -4,8 +4,6 @@ This module handles automatic installation of dependencies and configuration
 to make the tool work out-of-the-box on fresh WSL/Ubuntu or macOS systems.
 """
 
-import platform
-from importlib import resources
 from pathlib import Path
 
 from .shell import command_exists, try_install_tool
@@ -111,6 +109,8 @@ def ensure_tmux_conf() -> bool:
     local_conf = config_dir / "tmux.conf.local"
     wrapper_conf = Path.home() / ".tmux.conf"
 
+    from importlib import resources
+
     # Always overwrite base config (gets updates)
     try:
         template_bytes = (
@@ -192,6 +192,8 @@ def ensure_wezterm_conf(interactive: bool = True) -> bool:
     wezterm_installed = command_exists("wezterm")
 
     # macOS-specific: Check for WezTerm.app if command not in PATH
+    import platform
+
     if not wezterm_installed and platform.system() == "Darwin":
         wezterm_app = Path("/Applications/WezTerm.app")
         wezterm_installed = wezterm_app.exists()
@@ -221,6 +223,8 @@ def ensure_wezterm_conf(interactive: bool = True) -> bool:
             print("Skipping WezTerm config")
             return True
 
+    from importlib import resources
+
     # Always overwrite base config (gets updates)
     try:
         template_bytes = (
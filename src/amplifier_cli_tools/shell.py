@@ -14,11 +14,12 @@ Example:
 
 from __future__ import annotations
 
-import platform
+import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import NoReturn
 
 
 class ShellError(Exception):
@@ -90,6 +91,48 @@ def run(
     return result
 
 
+# Commands found on PATH: name -> full path. Misses aren't recorded, so a
+# tool installed mid-run (try_install_tool) is still found afterwards.
+_command_paths: dict[str, str] = {}
+
+
+def resolve_command(name: str) -> str | None:
+    """Find a command on PATH, remembering where it was found.
+
+    Args:
+        name: Name of the command to look up.
+
+    Returns:
+        Path to the command, or None if it isn't on PATH.
+
+    Example:
+        >>> resolve_command("git")
+        '/usr/bin/git'
+    """
+    path = _command_paths.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _command_paths[name] = path
+    return path
+
+
+def exec_command(cmd_parts: list[str]) -> NoReturn:
+    """Replace the current process with cmd_parts (POSIX only).
+
+    Execs the path resolve_command found (e.g. during ensure_commands)
+    rather than having execvp search PATH again. Relative results, from
+    "." on PATH, are left to execvp since the cwd may have changed since.
+
+    Args:
+        cmd_parts: Command and arguments; cmd_parts[0] is looked up on PATH.
+    """
+    path = resolve_command(cmd_parts[0])
+    if path is not None and os.path.isabs(path):
+        os.execv(path, cmd_parts)
+    os.execvp(cmd_parts[0], cmd_parts)
+
+
 def command_exists(name: str) -> bool:
     """Check if command is available in PATH.
 
@@ -105,15 +148,18 @@ def command_exists(name: str) -> bool:
         >>> command_exists("nonexistent-cmd-12345")
         False
     """
-    return shutil.which(name) is not None
+    return resolve_command(name) is not None
 
 
-def ensure_commands(*names: str) -> None:
+def ensure_commands(*names: str) -> dict[str, str]:
     """Validate that required commands exist.
 
     Args:
         *names: Command names to check.
 
+    Returns:
+        Dict mapping each command name to its path.
+
     Raises:
         ShellError: If any command is missing from PATH.
 
@@ -121,10 +167,12 @@ def ensure_commands(*names: str) -> None:
         >>> ensure_commands("git", "python")  # OK if both exist
         >>> ensure_commands("nonexistent")  # Raises ShellError
     """
-    missing = [name for name in names if not command_exists(name)]
+    paths = {name: resolve_command(name) for name in names}
+    missing = [name for name, path in paths.items() if path is None]
     if missing:
         missing_str = ", ".join(missing)
         raise ShellError(f"Required commands not found: {missing_str}")
+    return paths
 
 
 # Package manager mappings for different platforms
@@ -244,6 +292,8 @@ def _detect_package_manager() -> str | None:
     Returns:
         Package manager name ('brew', 'apt', 'dnf') or None if not found.
     """
+    import platform
+
     system = platform.system()
 
     if system == "Darwin":
@@ -291,6 +341,8 @@ def try_install_tool(name: str) -> bool:
         return False
 
     # Special case: lazygit on Linux uses GitHub releases
+    import platform
+
     if name == "lazygit" and platform.system() == "Linux":
         return _install_lazygit_linux()
 
@@ -355,6 +407,8 @@ def try_install_tool(name: str) -> bool:
 __all__ = [
     "ShellError",
     "run",
+    "resolve_command",
+    "exec_command",
     "command_exists",
     "ensure_commands",
     "try_install_tool",
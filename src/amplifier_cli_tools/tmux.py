@@ -11,9 +11,12 @@ import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .config import WindowConfig
-from .shell import command_exists, run, try_install_tool
+from .shell import ShellError, command_exists, exec_command, run, try_install_tool
+
+if TYPE_CHECKING:
+    from .config import WindowConfig
 
 
 def _run_tmux(*args: str) -> None:
@@ -25,6 +28,27 @@ def _run_tmux(*args: str) -> None:
     subprocess.run(["tmux", *args], check=True)
 
 
+def _run_tmux_sequence(commands: list[list[str]]) -> None:
+    """Run several tmux commands through a single tmux client invocation.
+
+    Commands are joined with tmux's ';' separator, so the whole sequence
+    costs one process spawn and one round trip to the server. As with
+    _run_tmux(), arguments are passed directly (no shell parsing).
+
+    Args:
+        commands: tmux commands, each as a list of arguments.
+    """
+    args: list[str] = []
+    for command in commands:
+        if args:
+            args.append(";")
+        for arg in command:
+            # tmux treats a trailing ';' on any argument as a separator;
+            # '\;' keeps it literal
+            args.append(arg[:-1] + "\\;" if arg.endswith(";") else arg)
+    _run_tmux(*args)
+
+
 __all__ = [
     "session_exists",
     "kill_session",
@@ -42,19 +66,36 @@ def session_exists(name: str) -> bool:
     Returns:
         True if session exists, False otherwise.
     """
-    result = run(f"tmux has-session -t {shlex.quote(name)} 2>/dev/null", check=False)
+    # List form runs tmux directly instead of via /bin/sh; stderr is captured
+    try:
+        result = run(["tmux", "has-session", "-t", name], check=False)
+    except ShellError:
+        return False  # tmux not installed
     return result.returncode == 0
 
 
-def kill_session(name: str, clear_resurrect: bool = False) -> None:
+def kill_session(
+    name: str, clear_resurrect: bool = False, missing_ok: bool = False
+) -> None:
     """Kill tmux session.
 
     Args:
         name: Session name to kill.
         clear_resurrect: If True, also clear tmux-resurrect data.
+        missing_ok: If True, ignore failures (e.g. no such session) instead
+            of raising. For defensive kills, where the session usually
+            doesn't exist; this skips a separate `tmux has-session`.
+
+    Raises:
+        ShellError: If the kill fails and missing_ok is False.
     """
-    if session_exists(name):
-        run(f"tmux kill-session -t {shlex.quote(name)}")
+    if missing_ok:
+        try:
+            run(["tmux", "kill-session", "-t", name], check=False)
+        except ShellError:
+            pass  # tmux not installed - nothing to kill
+    else:
+        run(["tmux", "kill-session", "-t", name])
 
     if clear_resurrect:
         resurrect_dir = Path.home() / ".tmux" / "resurrect"
@@ -74,7 +115,7 @@ def create_session(
     main_window_name: str,
     main_command: str,
     prompt: str,
-    windows: list[WindowConfig],
+    windows: tuple[WindowConfig, ...],
 ) -> None:
     """Create tmux session with configured windows.
 
@@ -84,14 +125,14 @@ def create_session(
         main_window_name: Name of the main window.
         main_command: Command to run in main window (e.g., "amplifier run").
         prompt: Prompt text to pass to main command.
-        windows: List of additional window configurations.
+        windows: Additional window configurations.
     """
     # Defensively kill any session with this name to handle race conditions.
     # This handles the case where tmux-resurrect or tmux-continuum auto-restores
     # a session AFTER our session_exists() check but BEFORE we create.
     # Since we're in create_session(), the caller already verified the session
     # shouldn't exist, so anything here is a zombie/race artifact.
-    kill_session(name)
+    kill_session(name, missing_ok=True)
 
     # Create temp directory for rcfiles
     rcfile_dir = Path(tempfile.gettempdir()) / f"amplifier-dev-rcfiles-{os.getpid()}"
@@ -102,23 +143,28 @@ def create_session(
 
     # Create the session with main window
     # Match bash script exactly: NO -c flag (cd is in rcfile), pass shell-command as single arg
-    # Using _run_tmux() avoids shell parsing that mangles quotes
-    _run_tmux(
-        "new-session",
-        "-d",
-        "-s",
-        name,
-        "-n",
-        main_window_name,
-        f"exec bash --rcfile '{main_rcfile}'",
-    )
+    commands = [
+        [
+            "new-session",
+            "-d",
+            "-s",
+            name,
+            "-n",
+            main_window_name,
+            f"exec bash --rcfile '{main_rcfile}'",
+        ]
+    ]
 
     # Create additional windows
     for window_config in windows:
-        _create_window(name, window_config, workdir, rcfile_dir)
+        commands.extend(_window_commands(name, window_config, workdir, rcfile_dir))
 
     # Select the main window so we attach to it
-    _run_tmux("select-window", "-t", f"{name}:{main_window_name}")
+    commands.append(["select-window", "-t", f"{name}:{main_window_name}"])
+
+    # Issue everything as one tmux command sequence; using _run_tmux_sequence()
+    # avoids shell parsing that mangles quotes
+    _run_tmux_sequence(commands)
 
 
 def select_window(session: str, window: str) -> None:
@@ -179,7 +225,7 @@ def attach_session(name: str) -> None:
             result = subprocess.run(["tmux", "switch-client", "-t", name])
             sys.exit(result.returncode)
         else:
-            os.execvp("tmux", ["tmux", "switch-client", "-t", name])
+            exec_command(["tmux", "switch-client", "-t", name])
     else:
         # Outside tmux - attach to session
         if sys.platform == "win32":
@@ -188,7 +234,7 @@ def attach_session(name: str) -> None:
             result = subprocess.run(["tmux", "attach-session", "-t", name])
             sys.exit(result.returncode)
         else:
-            os.execvp("tmux", ["tmux", "attach-session", "-t", name])
+            exec_command(["tmux", "attach-session", "-t", name])
 
 
 def _create_main_rcfile(
@@ -267,19 +313,25 @@ cd {shlex.quote(str(workdir))}
     return rcfile
 
 
-def _create_window(
+def _window_commands(
     session: str,
     config: WindowConfig,
     workdir: Path,
     rcfile_dir: Path,
-) -> None:
-    """Create a window in the tmux session.
+) -> list[list[str]]:
+    """Build the tmux commands that create a window in the session.
+
+    Missing tools are installed (or reported) here, before any tmux
+    command runs.
 
     Args:
         session: Session name.
         config: Window configuration.
         workdir: Working directory.
         rcfile_dir: Directory for rcfiles.
+
+    Returns:
+        tmux commands, each as a list of arguments.
     """
 
     # Special handling for "shell" window - create with 2 horizontal panes
@@ -287,23 +339,24 @@ def _create_window(
         shell_rcfile = _create_shell_rcfile(rcfile_dir, workdir)
 
         # Match bash script: NO -c flag, pass shell-command as single arg
-        _run_tmux(
-            "new-window",
-            "-t",
-            session,
-            "-n",
-            config.name,
-            f"exec bash --rcfile '{shell_rcfile}'",
-        )
-        # Split horizontally for second pane
-        _run_tmux(
-            "split-window",
-            "-h",
-            "-t",
-            f"{session}:{config.name}",
-            f"exec bash --rcfile '{shell_rcfile}'",
-        )
-        return
+        return [
+            [
+                "new-window",
+                "-t",
+                session,
+                "-n",
+                config.name,
+                f"exec bash --rcfile '{shell_rcfile}'",
+            ],
+            # Split horizontally for second pane
+            [
+                "split-window",
+                "-h",
+                "-t",
+                f"{session}:{config.name}",
+                f"exec bash --rcfile '{shell_rcfile}'",
+            ],
+        ]
 
     # For other windows, check if the tool exists
     tool_name = _extract_tool_name(config.command)
@@ -312,8 +365,7 @@ def _create_window(
         # Try to install the tool
         if not try_install_tool(tool_name):
             # Installation failed - create window with instructions
-            _create_missing_tool_window(session, config.name, tool_name, workdir)
-            return
+            return [_missing_tool_window_command(session, config.name, tool_name, workdir)]
 
     # Tool exists or no tool needed - create window with command
     # Create rcfile for this command window (like bash script does)
@@ -326,43 +378,48 @@ cd {shlex.quote(str(workdir))}
     cmd_rcfile.write_text(cmd_rcfile_content)
     cmd_rcfile.chmod(0o755)
 
-    _run_tmux(
-        "new-window",
-        "-t",
-        session,
-        "-n",
-        config.name,
-        f"exec bash --rcfile '{cmd_rcfile}'",
-    )
+    return [
+        [
+            "new-window",
+            "-t",
+            session,
+            "-n",
+            config.name,
+            f"exec bash --rcfile '{cmd_rcfile}'",
+        ]
+    ]
 
 
-def _create_missing_tool_window(
+def _missing_tool_window_command(
     session: str,
     window_name: str,
     tool_name: str,
     workdir: Path,
-) -> None:
-    """Create window with instructions for missing tool.
+) -> list[str]:
+    """Build the tmux command for a window with instructions for a missing tool.
 
     Args:
         session: Session name.
         window_name: Window name.
         tool_name: Name of the missing tool.
         workdir: Working directory.
+
+    Returns:
+        tmux command as a list of arguments.
     """
     # Get install instructions based on tool
     install_cmd = _get_install_instruction(tool_name)
     message = f"Tool '{tool_name}' not found. Install with: {install_cmd}"
 
     # Create window that displays the message then drops to shell
-    _run_tmux(
+    return [
         "new-window",
         "-t",
         session,
         "-n",
         window_name,
         f"bash -c 'cd {shlex.quote(str(workdir))}; echo {shlex.quote(message)}; exec bash'",
-    )
+    ]
 
 
 def _extract_tool_name(command: str) -> str | None: